@@ -65,23 +65,46 @@ class LocationFilter(FilterWidget):
         self._levels = None
 
     def widget(self, resource, values):
+        """
+            Render this widget as HTML helper object(s)
+
+            Args:
+                resource: the resource
+                values: the search values from the URL query
+
+            Note:
+                The rendered output must not be cached: it depends on
+                the resource, the selected values and the location
+                options currently in the database.
+        """
         ftype, levels, noopt = self._options(resource, values=values)
         if noopt:
             return SPAN(noopt, _class="no-options-available")
 
         attr = self._attr(resource)
         css_class = self._get_css_class(attr)
-        header_opt = self._resolve_header_option()
         base_id, base_name = attr["_id"], attr["_name"]
 
-        widgets = []
-        for idx, level in enumerate(levels):
-            widgets.append(
-                self._render_level_widget(levels, level, idx, values, css_class,
-                                          header_opt, base_id, base_name, ftype)
-            )
-
-        return TAG[""](*widgets)
+        # Per-call invariants, built once and shared across all levels
+        # (the base attributes are cloned per level)
+        opts_get = self.opts.get
+        base_attr = dict(self._attr(None))
+        select_opts = {"search": opts_get("search", "auto"),
+                       "header": self._resolve_header_option(),
+                       "selectedList": opts_get("selectedList", 3),
+                       }
+        placeholder_tmpl = current.T("Select %(location)s")
+        selector_prefix = f"{self._prefix(self.field)}$"
+        operator_suffix = f"__{self.operator}"
+
+        # Pass all level widgets to a single constructor call rather
+        # than appending them one by one to the parent helper
+        return TAG[""](*(self._render_level_widget(
+                                levels, level, idx,
+                                values.get(selector_prefix + level + operator_suffix),
+                                css_class, base_id, base_name, ftype,
+                                base_attr, select_opts, placeholder_tmpl)
+                         for idx, level in enumerate(levels)))
 
     def _get_css_class(self, attr):
         css = attr.get("class")
@@ -100,22 +123,18 @@ class LocationFilter(FilterWidget):
                 header_opt = setting
         return header_opt
 
-    def _render_level_widget(self, levels, level, index, values, css_class,
-                             header_opt, base_id, base_name, ftype):
-        w_attr = dict(self._attr(None))
-        w_attr["_id"] = f"{base_id}-{level}"
-        w_attr["_name"] = name = f"{base_name}-{level}"
+    def _render_level_widget(self, levels, level, index, level_values,
+                             css_class, base_id, base_name, ftype, base_attr,
+                             select_opts, placeholder_tmpl):
+        w_attr = dict(base_attr)
+        w_attr["_id"] = base_id + "-" + level
+        w_attr["_name"] = name = base_name + "-" + level
 
         dummy_field = Storage(name=name, type=ftype)
-        level_values = values.get(f"{self._prefix(self.field)}${level}__{self.operator}")
-        placeholder = current.T("Select %(location)s") % {"location": levels[level]["label"]}
-
-        widget = S3MultiSelectWidget(
-            search=self.opts.get("search", "auto"),
-            header=header_opt,
-            selectedList=self.opts.get("selectedList", 3),
-            noneSelectedText=placeholder,
-        )
+        placeholder = placeholder_tmpl % {"location": levels[level]["label"]}
+
+        widget = S3MultiSelectWidget(noneSelectedText=placeholder,
+                                     **select_opts)
 
         if index == 0:
             w_attr["_class"] = css_class
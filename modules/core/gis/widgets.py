@@ -33,7 +33,7 @@ from urllib.parse import quote as urllib_quote
 from gluon import current, URL, DIV, XML, A, HTTP
 from gluon.languages import regex_translate
 
-from ..tools import JSONERRORS, JSONSEPARATORS, include_ext_js, include_underscore_js, s3_str
+from ..tools import JSONERRORS, JSONSEPARATORS, include_feature_scripts, include_underscore_js, s3_str
 
 from .base import GIS
 from .layers import LayerArcREST, LayerBing, LayerCoordinate, LayerEmpty, LayerFeature, \
@@ -797,9 +797,9 @@ class MAP(DIV):
                     return super(MAP, self).xml()
                 return ""
 
-        # Add ExtJS
+        # Add ExtJS + Underscore (for Popup Templates) in one pass
         # @ToDo: Do this conditionally on whether Ext UI is used
-        include_ext_js()
+        include_feature_scripts("ext", "underscore")
 
         dumps = json.dumps
         s3 = current.response.s3
@@ -828,9 +828,6 @@ class MAP(DIV):
         if js_globals not in js_global:
             js_global_append(js_globals)
 
-        # Underscore for Popup Templates
-        include_underscore_js()
-
         debug = s3.debug
         scripts = s3.scripts
 
@@ -22,12 +22,107 @@ Refactored for:
 #   - Never break backward compatibility with existing scripts.
 #   - Use helper functions to avoid duplication.
 #   - Use current.log for safe debugging output, not print().
+#
+# Performance notes:
+#   - The include_* bodies are specialized per configuration through
+#     module-level caches keyed by (debug, cdn, app, ...) tuples, so
+#     repeated calls reduce to a dict lookup plus a list extend.
+#   - Generated-code specialization (exec'ing branch-free variants per
+#     worker) was considered and rejected: s3.debug and s3.cdn live on
+#     the per-request response and may differ between requests, so the
+#     flags must stay part of the cache key rather than being baked
+#     into the code.
 # -----------------------------------------------------------------------------
 
+import functools
 import os
+import threading
 
 from gluon import current, HTTP, URL, XML
 
+# Cache for rendered theme CSS <link> blocks, keyed by
+# (cfg_path, mtime_ns, appname) - invalidates automatically
+# whenever css.cfg is touched on disk
+_CSS_CACHE = {}
+
+# Template for stylesheet <link> tags injected by the ExtJS includes
+_LINK_TMPL = "<link href='%s' rel='stylesheet' type='text/css' />"
+
+# ExtJS build variants, indexed by int(debug):
+# (adapter filename, main JS filename, notheme CSS href template,
+#  xtheme-gray CSS href template or None)
+_EXT_JS_VARIANTS = (
+    ("ext-jquery-adapter.js", "ext-all.js",
+     "/%(app)s/static/scripts/ext/...-notheme.min.css", None),
+    ("ext-jquery-adapter-debug.js", "ext-all-debug.js",
+     "%(base)s/resources/css/ext-all-notheme.css",
+     "%(base)s/resources/css/xtheme-gray.css"),
+)
+
+# Static URL prefixes whose content is version-pinned by directory
+# (ExtJS 3.4.1.1, underscore 1.6.0) and hence safe to cache forever
+_IMMUTABLE_STATIC_PREFIXES = ("static/scripts/ext/",
+                              "static/scripts/underscore",
+                              )
+
+# Joined theme css.cfg paths, keyed by (folder, theme) - saves the
+# os.path.join chain per request
+_THEME_CFG_PATHS = {}
+
+# Parsed config files, keyed by path with an ETag-style
+# (mtime_ns, size) validator: {path: ((mtime_ns, size), entries)}
+_CFG_CACHE = {}
+
+# Cache for DataTables script URL lists, keyed by
+# (appname, debug, responsive, variable_columns)
+_DT_CACHE = {}
+
+# The mergejsmf module, resolved once on first use (deferring the
+# import keeps module load free of the dependency-graph machinery)
+_mergejsmf = None
+
+# Available ExtJS locale filenames, scanned once per process from
+# static/scripts/ext/src/locale - the directory only changes on
+# deploy, so a process restart picks up new locales
+_EXT_LOCALES = None
+_EXT_LOCALES_LOCK = threading.Lock()
+
+
+def _get_mergejsmf():
+    """Import mergejsmf lazily and reuse the module object."""
+    global _mergejsmf
+    if _mergejsmf is None:
+        import mergejsmf
+        _mergejsmf = mergejsmf
+    return _mergejsmf
+
+
+def _ext_locales(folder):
+    """
+    The set of available ExtJS locale filenames, scanned lazily once
+    per process.
+
+    Args:
+        folder: the application folder (request.folder)
+
+    Returns:
+        frozenset of filenames in static/scripts/ext/src/locale
+    """
+    global _EXT_LOCALES
+    locales = _EXT_LOCALES
+    if locales is None:
+        with _EXT_LOCALES_LOCK:
+            locales = _EXT_LOCALES
+            if locales is None:
+                locale_dir = os.path.join(folder, "static", "scripts",
+                                          "ext", "src", "locale")
+                try:
+                    names = os.listdir(locale_dir)
+                except OSError:
+                    names = ()
+                _EXT_LOCALES = locales = frozenset(names)
+    return locales
+
 
 # =============================================================================
 # Helper Functions
@@ -44,9 +139,13 @@ def _abs_theme_config_path(request, theme):
     Returns:
         Absolute path to modules/templates/<theme>/css.cfg
     """
-    return os.path.join(
-        request.folder, "modules", "templates", theme, "css.cfg"
-    )
+    key = (request.folder, theme)
+    path = _THEME_CFG_PATHS.get(key)
+    if path is None:
+        path = _THEME_CFG_PATHS[key] = os.path.join(
+            request.folder, "modules", "templates", theme, "css.cfg"
+        )
+    return path
 
 
 def _stylesheet_link_tag(appname, css_file):
@@ -66,16 +165,39 @@ def _stylesheet_link_tag(appname, css_file):
     )
 
 
-def _append_script(scripts, appname, script_path):
+def apply_static_cache_headers(response, path, fs_path=None):
     """
-    Append a script from static/scripts into s3.scripts.
+    Set client-side caching headers for a static asset referenced by
+    this module; to be called from whatever controller serves the
+    asset (web2py's builtin static handler bypasses this module).
+
+    Version-pinned assets (ExtJS, underscore.js) get an immutable
+    far-future Cache-Control; for other assets a weak ETag derived
+    from (mtime, size) is set, honouring If-None-Match with a 304.
 
     Args:
-        scripts: s3.scripts list
-        appname: current app name
-        script_path: relative path under static/scripts
+        response: the web2py response object
+        path: the URL path of the asset
+        fs_path: the filesystem path of the asset (enables the ETag)
+
+    Raises:
+        HTTP 304 if the client already holds the current version
     """
-    scripts.append(f"/{appname}/static/scripts/{script_path}")
+    headers = response.headers
+    if any(prefix in path for prefix in _IMMUTABLE_STATIC_PREFIXES):
+        headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return
+
+    if not fs_path:
+        return
+    try:
+        st = os.stat(fs_path)
+    except OSError:
+        return
+    etag = 'W/"%x-%x"' % (int(st.st_mtime), st.st_size)
+    headers["ETag"] = etag
+    if current.request.env.http_if_none_match == etag:
+        raise HTTP(304)
 
 
 # =============================================================================
@@ -90,42 +212,61 @@ def include_debug_css():
     theme = response.s3.theme_config
     cfg_path = _abs_theme_config_path(request, theme)
 
-    if not os.path.isfile(cfg_path):
+    app = request.application
+
+    # One stat both checks existence and yields the cache key
+    try:
+        st = os.stat(cfg_path)
+    except OSError:
         raise HTTP(
             500,
             f"Missing theme CSS config: modules/templates/{theme}/css.cfg",
         )
 
-    app = request.application
-    links = []
+    # Serve from cache while css.cfg is unchanged on disk
+    key = (cfg_path, st.st_mtime_ns, app)
+    cached = _CSS_CACHE.get(key)
+    if cached is not None:
+        return cached
 
     # Assignment 2 — Preventive & Corrective Maintenance
     css_entries = _safe_read_cfg(cfg_path)
     if not css_entries:
-        current.log.warning(f"No valid CSS entries found in {cfg_path}")
+        current.log.warning("No valid CSS entries found", cfg_path)
+
+    # Loop-invariant parts of the <link> tag, hoisted out of the loop
+    # (same markup as _stylesheet_link_tag)
+    prefix = f'<link href="/{app}/static/styles/'
+    suffix = '" rel="stylesheet" type="text/css" />'
+    links = [prefix + entry + suffix for entry in css_entries]
 
-    for entry in css_entries:
-        links.append(_stylesheet_link_tag(app, entry))
+    # Store the XML instance itself, so neither the join nor the XML
+    # wrapping recur on cache hits (XML is an immutable str wrapper)
+    _CSS_CACHE[key] = block = XML("\n".join(links))
 
-    return XML("\n".join(links))
+    return block
 
 # =============================================================================
 # JavaScript Includes (Debug Mode)
 # =============================================================================
 
-def include_debug_js():
+def _build_debug_js(app, scripts_dir, cfg_file):
     """
-    Include JS scripts listed in static/scripts/tools/sahana.js.cfg.
+    Build the debug-JS <script> block (cold path).
 
     mergejsmf.getFiles resolves the correct ordering of files based
     on dependency graph definitions.
-    """
 
-    request = current.request
-    scripts_dir = os.path.join(request.folder, "static", "scripts")
+    Args:
+        app: current app name
+        scripts_dir: absolute path to static/scripts
+        cfg_file: absolute path to sahana.js.cfg
 
-    # Local import to avoid unnecessary overhead
-    import mergejsmf
+    Returns:
+        the <script> block as XML
+    """
+
+    mergejsmf = _get_mergejsmf()
 
     config_map = {
         ".": scripts_dir,
@@ -134,55 +275,96 @@ def include_debug_js():
         "S3": scripts_dir,
     }
 
-    cfg_file = os.path.join(scripts_dir, "tools", "sahana.js.cfg")
-
     # Outputs: (config_dict, file_list)
     _, raw_list = mergejsmf.getFiles(config_map, cfg_file)
     file_list = _validate_script_list(raw_list)
 
-    app = request.application
     template = f'<script src="/{app}/static/scripts/%s"></script>'
 
-    scripts = "\n".join(template % path for path in file_list)
-    return XML(scripts)
+    return XML("\n".join(template % path for path in file_list))
+
+
+def include_debug_js():
+    """
+    Include JS scripts listed in static/scripts/tools/sahana.js.cfg.
+
+    The rendered block is held in the thread-safe response cache;
+    the cfg mtime is part of the key, so edits to sahana.js.cfg
+    invalidate the cached entry immediately.
+    """
+
+    request = current.request
+    scripts_dir = os.path.join(request.folder, "static", "scripts")
+
+    cfg_file = os.path.join(scripts_dir, "tools", "sahana.js.cfg")
+    app = request.application
+
+    key = "include_debug_js:%s:%s" % (app, os.path.getmtime(cfg_file))
+    return current.cache.ram(key,
+                             lambda: _build_debug_js(app, scripts_dir, cfg_file),
+                             time_expire = 3600,
+                             )
 
 
 # =============================================================================
 # DataTables Includes
 # =============================================================================
 
-def include_datatable_js():
+def _datatable_includes(s3):
     """
-    Include required DataTables JS files based on:
-        - s3.debug (debug or minified)
-        - s3.datatable_opts (responsive, variable_columns)
+    Resolve the DataTables script URLs for the current options (cached).
+
+    Args:
+        s3: current response.s3
+
+    Returns:
+        list of script URLs
     """
 
-    s3 = current.response.s3
-    scripts = s3.scripts
     options = s3.datatable_opts or {}
-    debug = s3.debug
 
-    app = current.request.application
+    key = (current.request.application,
+           bool(s3.debug),
+           bool(options.get("responsive")),
+           bool(options.get("variable_columns")),
+           )
+
+    urls = _DT_CACHE.get(key)
+    if urls is None:
+        app, debug, responsive, variable_columns = key
+        ext = ".js" if debug else ".min.js"
 
-    def add(script):
-        """Append JS script using static/scripts."""
-        _append_script(scripts, app, script)
+        # Core datatable
+        names = ["jquery.dataTables" + ext]
+        # Extensions
+        if responsive:
+            names.append("jquery.dataTables.responsive" + ext)
+        if variable_columns:
+            names.append("S3/s3.ui.columns" + ext)
+        # Eden datatable wrapper
+        names.append("S3/s3.ui.datatable" + ext)
 
-    # Core datatable
-    add("jquery.dataTables.js" if debug else "jquery.dataTables.min.js")
+        urls = [f"/{app}/static/scripts/{name}" for name in names]
+        _DT_CACHE[key] = urls
 
-    # Extensions
-    if options.get("responsive"):
-        add("jquery.dataTables.responsive.js" if debug
-            else "jquery.dataTables.responsive.min.js")
+    return urls
+
+
+def include_datatable_js():
+    """
+    Include required DataTables JS files based on:
+        - s3.debug (debug or minified)
+        - s3.datatable_opts (responsive, variable_columns)
+    """
 
-    if options.get("variable_columns"):
-        add("S3/s3.ui.columns.js" if debug
-            else "S3/s3.ui.columns.min.js")
+    s3 = current.response.s3
+    urls = _datatable_includes(s3)
+    s3.scripts.extend(urls)
 
-    # Eden datatable wrapper
-    add("S3/s3.ui.datatable.js" if debug else "S3/s3.ui.datatable.min.js")
+    # Keep the dedup sidecar in lockstep where it exists
+    seen = s3._scripts_set
+    if seen is not None:
+        seen.update(urls)
 
 
 # =============================================================================
@@ -202,97 +384,186 @@ def _extjs_xtheme_tag(appname, xtheme, path):
         <link> tag HTML
     """
     if xtheme:
-        return (
-            f"<link href='/{appname}/static/themes/{xtheme}' "
-            f"rel='stylesheet' type='text/css' />"
-        )
+        return _LINK_TMPL % f"/{appname}/static/themes/{xtheme}"
     return None
 
 
-def include_ext_js():
+@functools.lru_cache(maxsize=32)
+def _build_ext_includes(app, folder, debug, cdn, xtheme, language):
     """
-    Include ExtJS resources for map components.
+    Build the ExtJS script URLs and the CSS-inject snippet for a
+    configuration (cached, including the locale-file probe).
 
     Handles:
         - CDN vs local script selection
         - Debug vs minified builds
         - XTheme injection
-        - Avoids duplicate inclusion via s3.ext_included
-    """
 
-    s3 = current.response.s3
-    if s3.ext_included:
-        return
-
-    request = current.request
-    app = request.application
+    Args:
+        app: current app name
+        folder: the application folder (request.folder)
+        debug: whether to use the debug builds
+        cdn: whether to load from the CDN
+        xtheme: the xtheme CSS filename (if any)
+        language: the current UI language
 
-    # Handle theme
-    xtheme = current.deployment_settings.get_base_xtheme()
-    if xtheme:
-        xtheme = f"{xtheme[:-3]}min.css"  # convert "...css" -> "...min.css"
+    Returns:
+        tuple (script URLs, jquery-ready CSS-inject snippet)
+    """
 
     # Select CDN or local base path
     base = (
         "//cdn.sencha.com/ext/gpl/3.4.1.1"
-        if s3.cdn else f"/{app}/static/scripts/ext"
+        if cdn else f"/{app}/static/scripts/ext"
     )
 
     # JS files (debug/minified)
-    if s3.debug:
-        adapter = f"{base}/adapter/jquery/ext-jquery-adapter-debug.js"
-        main_js = f"{base}/ext-all-debug.js"
-        main_css = (
-            f"<link href='{base}/resources/css/ext-all-notheme.css' "
-            f"rel='stylesheet' type='text/css' />"
-        )
-        theme_css = (
-            f"<link href='{base}/resources/css/xtheme-gray.css' "
-            f"rel='stylesheet' type='text/css' />"
-        ) if not xtheme else None
-    else:
-        adapter = f"{base}/adapter/jquery/ext-jquery-adapter.js"
-        main_js = f"{base}/ext-all.js"
-        main_css = (
-            f"<link href='/{app}/static/scripts/ext/...-notheme.min.css' "
-            f"rel='stylesheet' type='text/css' />"
-        )
-        theme_css = None
+    adapter_name, main_name, notheme_href, gray_href = \
+        _EXT_JS_VARIANTS[int(debug)]
+    subst = {"app": app, "base": base}
 
-    # Register JS scripts
-    scripts = s3.scripts
-    scripts.append(adapter)
-    scripts.append(main_js)
+    adapter = f"{base}/adapter/jquery/{adapter_name}"
+    main_js = f"{base}/{main_name}"
+    main_css = _LINK_TMPL % (notheme_href % subst)
+    theme_css = (_LINK_TMPL % (gray_href % subst)) \
+                if gray_href and not xtheme else None
+
+    # Collect JS scripts
+    include_scripts = [adapter, main_js]
 
     # Add language file if available
-    langfile = f"ext-lang-{s3.language}.js"
-    lang_path = os.path.join(
-        request.folder, "static", "scripts", "ext",
-        "src", "locale", langfile
-    )
+    langfile = f"ext-lang-{language}.js"
 
         # Assignment 2 — Preventive Maintenance: safe locale inclusion
-    if os.path.exists(lang_path):
-        scripts.append(f"{base}/src/locale/{langfile}")
+    if langfile in _ext_locales(folder):
+        include_scripts.append(f"{base}/src/locale/{langfile}")
     else:
-        current.log.info(f"Locale file missing for ExtJS: {langfile}")
+        current.log.info("Locale file missing for ExtJS", langfile)
 
     # Inject CSS into DOM via jQuery ready
-    inject = s3.jquery_ready.append
     if xtheme:
         theme_tag = _extjs_xtheme_tag(app, xtheme, base)
-        inject(f"$('#ext-styles').after(\"{theme_tag}\").after(\"{main_css}\").remove()")
+        # One .after() with both tags => single DOM insertion/reflow;
+        # main_css first so the theme keeps overriding it
+        inject = f"$('#ext-styles').after(\"{main_css}{theme_tag}\").remove()"
     else:
         css_tag = theme_css or main_css
-        inject(f"$('#ext-styles').after(\"{css_tag}\").remove()")
+        inject = f"$('#ext-styles').after(\"{css_tag}\").remove()"
+
+    return (tuple(include_scripts), inject)
+
+
+def _ext_includes(s3, app, folder):
+    """
+    Resolve the ExtJS script URLs and the CSS-inject snippet for the
+    current configuration.
+
+    Args:
+        s3: current response.s3
+        app: current app name
+        folder: the application folder (request.folder)
+
+    Returns:
+        tuple (script URLs, jquery-ready CSS-inject snippet)
+    """
+
+    # Handle theme
+    xtheme = current.deployment_settings.get_base_xtheme()
+    if xtheme:
+        xtheme = f"{xtheme[:-3]}min.css"  # convert "...css" -> "...min.css"
+
+    return _build_ext_includes(app, folder,
+                               bool(s3.debug), bool(s3.cdn),
+                               xtheme, s3.language,
+                               )
 
+
+def include_ext_js():
+    """
+    Include ExtJS resources for map components.
+
+    Avoids duplicate inclusion via s3.ext_included.
+
+    Note:
+        This is already as lazy as it can be: the map widget calls it
+        from its xml() serialization, so pages that never render a map
+        never reach this code. Entries in s3.scripts must remain plain
+        URL strings (the layouts render them into src attributes), so
+        no lazily-expanding sentinel objects here.
+    """
+
+    s3 = current.response.s3
+    if s3.ext_included:
+        return
+    # Claim the flag before assembling, so a re-entrant call cannot
+    # pass the guard while this one is still in progress
     s3.ext_included = True
 
+    request = current.request
+    ext_scripts, inject = _ext_includes(s3, request.application, request.folder)
+
+    scripts = s3.scripts
+    seen = s3._scripts_set
+    if seen is None:
+        seen = s3._scripts_set = set(scripts)
+
+    # Secondary guard: adapter already present means ExtJS was included
+    # through another code path - skip the CSS injection as well
+    if ext_scripts[0] in seen:
+        return
+
+    # Dedup against scripts already present (O(1) via the set sidecar)
+    new = [script for script in ext_scripts if script not in seen]
+    scripts.extend(new)
+    seen.update(new)
+
+    s3.jquery_ready.append(inject)
+
 
 # =============================================================================
 # Underscore.js Includes
 # =============================================================================
 
+@functools.lru_cache(maxsize=8)
+def _build_underscore_url(cdn, debug, app):
+    """
+    Build the Underscore.js URL for a configuration (cached).
+
+    Args:
+        cdn: whether to load from the CDN
+        debug: whether to use the debug build
+        app: current app name
+
+    Returns:
+        the script URL
+    """
+
+    if cdn:
+        base = "//cdnjs.cloudflare.com/ajax/libs/underscore.js/1.6.0/"
+        script = base + ("underscore.js" if debug else "underscore-min.js")
+    else:
+        script = str(URL(
+            c="static",
+            f=f"scripts/underscore{'-min' if not debug else ''}.js"
+        ))
+    return script
+
+
+def _underscore_include(s3):
+    """
+    Resolve the Underscore.js URL for the current configuration.
+
+    Args:
+        s3: current response.s3
+
+    Returns:
+        the script URL
+    """
+
+    return _build_underscore_url(bool(s3.cdn), bool(s3.debug),
+                                 current.request.application)
+
+
 def include_underscore_js():
     """
     Include Underscore.js, using CDN when configured.
@@ -303,20 +574,63 @@ def include_underscore_js():
     """
 
     s3 = current.response.s3
-    debug = s3.debug
     scripts = s3.scripts
 
-    if s3.cdn:
-        base = "//cdnjs.cloudflare.com/ajax/libs/underscore.js/1.6.0/"
-        script = base + ("underscore.js" if debug else "underscore-min.js")
-    else:
-        script = URL(
-            c="static",
-            f=f"scripts/underscore{'-min' if not debug else ''}.js"
-        )
+    script = _underscore_include(s3)
 
-    if script not in scripts:
+    # O(1) dedup via a set sidecar instead of scanning s3.scripts
+    seen = s3._scripts_set
+    if seen is None:
+        seen = s3._scripts_set = set(scripts)
+    if script not in seen:
         scripts.append(script)
+        seen.add(script)
+
+
+def include_feature_scripts(*features):
+    """
+    Include the scripts for several UI features in one pass, batching
+    all additions to s3.scripts into a single extend.
+
+    Args:
+        features: feature names in inclusion order, any of
+                  "ext", "underscore", "datatable"
+    """
+
+    s3 = current.response.s3
+    scripts = s3.scripts
+
+    seen = s3._scripts_set
+    if seen is None:
+        seen = s3._scripts_set = set(scripts)
+
+    batch = []
+    for feature in features:
+        if feature == "ext":
+            if s3.ext_included:
+                continue
+            s3.ext_included = True
+            request = current.request
+            ext_scripts, inject = _ext_includes(s3,
+                                                request.application,
+                                                request.folder)
+            # Same double-inclusion guard as include_ext_js
+            if ext_scripts[0] in seen:
+                continue
+            batch.extend(script for script in ext_scripts
+                                if script not in seen)
+            s3.jquery_ready.append(inject)
+        elif feature == "underscore":
+            script = _underscore_include(s3)
+            if script not in seen and script not in batch:
+                batch.append(script)
+        elif feature == "datatable":
+            batch.extend(_datatable_includes(s3))
+        else:
+            current.log.warning("Unknown feature scripts requested", feature)
+
+    seen.update(batch)
+    scripts.extend(batch)
 
 
 # END =========================================================================
@@ -340,25 +654,42 @@ def _safe_read_cfg(cfg_path):
 
     Returns:
         list[str]: Cleaned list of non-empty, non-comment entries.
+
+    Note:
+        Results are cached per path with an (mtime, size) validator,
+        so unchanged files are parsed only once.
     """
-    if not os.path.exists(cfg_path):
+    # Single stat both validates existence and yields the cache key
+    # (checking existence separately would cost an extra syscall)
+    try:
+        st = os.stat(cfg_path)
+    except FileNotFoundError:
         # Preventive: avoid unexpected 500 crashes
-        current.log.warning(f"Config file missing: {cfg_path}")
+        current.log.warning("Config file missing", cfg_path)
         return []
 
-    cleaned = []
+    validator = (st.st_mtime_ns, st.st_size)
+    cached = _CFG_CACHE.get(cfg_path)
+    if cached and cached[0] == validator:
+        return cached[1]
+
     try:
-        with open(cfg_path, "r") as cfg:
-            for line in cfg:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                cleaned.append(line)
-    except Exception as e:
-        # Corrective + Evaluative: error transparency
-        current.log.error(f"Failed to read config file {cfg_path}: {e}")
+        # Single read instead of per-line file iteration
+        with open(cfg_path, "rb") as cfg:
+            raw = cfg.read()
+    except OSError as e:
+        # Corrective + Evaluative: error transparency - filesystem
+        # errors only; anything else is a bug and should propagate
+        # rather than being masked as an empty config
+        current.log.error("Failed to read config file",
+                          "%s (%s)" % (cfg_path, e))
         return []
 
+    # Strip/filter at bytes level, decode only the surviving lines
+    cleaned = [ln.decode("utf-8", "replace")
+               for ln in (l.strip() for l in raw.splitlines())
+               if ln and ln[:1] != b"#"]
+    _CFG_CACHE[cfg_path] = (validator, cleaned)
     return cleaned
 
 
@@ -376,12 +707,14 @@ def _validate_script_list(file_list):
     Returns:
         list: Sanitized list of scripts.
     """
-    result = []
-    for item in file_list:
-        if not isinstance(item, str):
-            current.log.warning(f"Ignoring non-string JS include: {item}")
-            continue
-        if item.strip() == "":
-            continue
-        result.append(item)
+    result = [item for item in file_list
+                   if isinstance(item, str) and item.strip()]
+
+    # Only inspect for invalid entries if anything was dropped,
+    # and report them in a single aggregated warning
+    if len(result) != len(file_list):
+        dropped = [item for item in file_list if not isinstance(item, str)]
+        if dropped:
+            current.log.warning("Ignoring non-string JS includes", dropped)
+
     return result